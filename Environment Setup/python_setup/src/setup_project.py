@@ -1,39 +1,184 @@
 import os
-import subprocess
 import sys
 import re
 import logging
+from pathlib import Path
 
-# Setup basic configuration for logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Compiled once at import so validation doesn't re-resolve the pattern on every call
+_FOLDER_NAME_RE = re.compile(r'[\w\- ]+\Z')
 
-def verify_folder_name(folder_name):
-    pattern = r'^[\w\- ]+$'
-    if re.match(pattern, folder_name):
-        logging.info(f"'{folder_name}' is a valid folder name.")
-    else:
-        logging.error(f"'{folder_name}' is not a valid folder name. Folder names must only contain alphanumeric characters, hyphens, and spaces.")
-        sys.exit(1)
+# Accepted answers for yes/no prompts
+_YES = frozenset({'yes', 'y'})
+_NO = frozenset({'no', 'n'})
+
+# Answer given to every yes/no prompt when running non-interactively (--yes/--no); None means ask the user
+_ASSUMED_ANSWER = None
+
+# File templates written into new projects
+_PIPFILE_CONTENT = """\
+# [[source]]
+# url = "https://pypi.org/simple"
+# verify_ssl = true
+# name = "pypi"
+
+# [packages]
+# db-dtypes = "*"
+
+# [dev-packages]
+# pytest = "*"
+# mypy = "*"
+# pandas-stubs = "*"
+
+# [requires]
+# python_version = "3.11"
+"""
+
+_GITIGNORE_CONTENT = """\
+# Byte-compiled / optimized / DLL files
+__pycache__/
+*.py[cod]
+*$py.class
+
+# C extensions
+*.so
+
+# Distribution / packaging
+.Python
+build/
+dist/
+downloads/
+eggs/
+lib/
+lib64/
+parts/
+sdist/
+var/
+wheels/
+pip-wheel-metadata/
+share/python-wheels/
+*.egg-info/
+.installed.cfg
+*.egg
+MANIFEST
+
+# PyInstaller
+*.manifest
+*.spec
+
+# Installer logs
+pip-log.txt
+pip-delete-this-directory.txt
+
+# Unit test / coverage reports
+htmlcov/
+.tox/
+.nox/
+.coverage
+.coverage.*
+.cache
+nosetests.xml
+coverage.xml
+*.cover
+*.py,cover
+.hypothesis/
+.pytest_cache/
+
+# Translations
+*.mo
+*.pot
+
+# Django stuff:
+*.log
+local_settings.py
+db.sqlite3
+db.sqlite3-journal
+
+# Flask stuff:
+instance/
+.webassets-cache
+
+# Scrapy stuff:
+.scrapy
+
+# Sphinx documentation
+docs/_build/
+
+# PyBuilder
+target/
+
+# Jupyter Notebook
+.ipynb_checkpoints
+
+# IPython
+profile_default/
+ipython_config.py
+
+# pyenv
+.python-version
+
+# pipenv
+#Pipfile.lock
+
+# PEP 582; used by e.g. github.com/David-OConnor/pyflow
+__pypackages__/
+
+# Celery stuff
+celerybeat-schedule
+celerybeat.pid
+
+# SageMath parsed files
+*.sage.py
+
+# Environments
+.env
+.venv
+env/
+venv/
+ENV/
+env.bak/
+venv.bak/
+
+# Spyder project settings
+.spyderproject
+.spyproject
+
+# Rope project settings
+.ropeproject
+
+# mkdocs documentation
+/site
+
+# mypy
+.mypy_cache/
+.dmypy.json
+dmypy.json
+
+# Pyre type checker
+.pyre/
+"""
+
+# Encoded once at import; files are written as bytes so no per-write encoding is needed
+_PIPFILE_BYTES = _PIPFILE_CONTENT.encode('utf-8')
+_GITIGNORE_BYTES = _GITIGNORE_CONTENT.encode('utf-8')
 
 def check_python3_installed():
-    try:
-        # Use sys.executable to get the path to the current Python interpreter
-        result = subprocess.run([sys.executable, "--version"], capture_output=True, text=True)
-        if result.returncode == 0:
-            logging.info(f"Python interpreter is installed: {result.stdout.strip()}")
-        else:
-            logging.error("Python interpreter is not installed.")
-            sys.exit(1)
-    except FileNotFoundError:
-        logging.error("Python interpreter is not installed.")
+    # We are already running inside an interpreter, so read its version directly
+    # instead of spawning a second one
+    if sys.version_info[0] < 3:
+        logging.error("Python 3 is required.")
         sys.exit(1)
+    logging.info("Python interpreter is installed: Python %s", sys.version.split()[0])
 
 def get_yes_no_input(prompt, retry_limit=3):
+    if _ASSUMED_ANSWER is not None:
+        logging.info("%s%s", prompt, 'yes' if _ASSUMED_ANSWER else 'no')
+        return _ASSUMED_ANSWER
+
     for _ in range(retry_limit):
-        response = input(prompt).strip().lower()
-        if response in ['yes', 'y']:
+        response = input(prompt).strip().casefold()
+        if response in _YES:
             return True
-        elif response in ['no', 'n']:
+        elif response in _NO:
             return False
         else:
             logging.info("Invalid input. Please answer 'yes' or 'no'.")
@@ -41,95 +186,128 @@ def get_yes_no_input(prompt, retry_limit=3):
     sys.exit(1)
 
 def manage_folder(folder_name):
-    if os.path.exists(folder_name):
+    if os.path.isdir(folder_name):
         use_existing = get_yes_no_input(f"The folder '{folder_name}' already exists. Do you want to use this existing folder? (yes/no): ")
         if use_existing:
-            logging.info(f"Using the existing folder: {folder_name}")
+            logging.info("Using the existing folder: %s", folder_name)
             return True
         else:
             logging.info("User chose not to use the existing folder.")
             return False
     else:
-        try:
-            os.makedirs(folder_name)
-            logging.info(f"Folder '{folder_name}' created.")
-            return True
-        except OSError as e:
-            logging.error(f"Failed to create the folder '{folder_name}': {e}")
-            return False
+        # The folder itself is created along with its subdirectories in create_project_structure
+        logging.info("Folder '%s' will be created.", folder_name)
+        return True
 
-def create_pipfile(folder_name):
-    pipfile_content = "# [[source]]\n# url = \"https://pypi.org/simple\"\n# verify_ssl = true\n# name = \"pypi\"\n\n# [packages]\n# db-dtypes = \"*\"\n\n# [dev-packages]\n# pytest = \"*\"\n# mypy = \"*\"\n# pandas-stubs = \"*\"\n\n# [requires]\n# python_version = \"3.11\""
-    pipfile_path = os.path.join(folder_name, "Pipfile")
+def create_pipfile(project_path):
+    pipfile_path = project_path / "Pipfile"
 
-    if check_and_overwrite_file(pipfile_path):
-        with open(pipfile_path, "w") as pipfile:
-            pipfile.write(pipfile_content)
+    if write_file(pipfile_path, _PIPFILE_BYTES):
         logging.info("Pipfile created.")
     else:
         logging.info("The existing Pipfile was not overwritten.")
 
-def create_gitignore(folder_name):
-    gitignore_path = os.path.join(folder_name, ".gitignore")
-    gitignore_content = "# Byte-compiled / optimized / DLL files\n__pycache__/\n*.py[cod]\n*$py.class\n\n# C extensions\n*.so\n\n# Distribution / packaging\n.Python\nbuild/\ndist/\ndownloads/\neggs/\nlib/\nlib64/\nparts/\nsdist/\nvar/\nwheels/\npip-wheel-metadata/\nshare/python-wheels/\n*.egg-info/\n.installed.cfg\n*.egg\nMANIFEST\n\n# PyInstaller\n*.manifest\n*.spec\n\n# Installer logs\npip-log.txt\npip-delete-this-directory.txt\n\n# Unit test / coverage reports\nhtmlcov/\n.tox/\n.nox/\n.coverage\n.coverage.*\n.cache\nnosetests.xml\ncoverage.xml\n*.cover\n*.py,cover\n.hypothesis/\n.pytest_cache/\n\n# Translations\n*.mo\n*.pot\n\n# Django stuff:\n*.log\nlocal_settings.py\ndb.sqlite3\ndb.sqlite3-journal\n\n# Flask stuff:\ninstance/\n.webassets-cache\n\n# Scrapy stuff:\n.scrapy\n\n# Sphinx documentation\ndocs/_build/\n\n# PyBuilder\ntarget/\n\n# Jupyter Notebook\n.ipynb_checkpoints\n\n# IPython\nprofile_default/\nipython_config.py\n\n# pyenv\n.python-version\n\n# pipenv\n#Pipfile.lock\n\n# PEP 582; used by e.g. github.com/David-OConnor/pyflow\n__pypackages__/\n\n# Celery stuff\ncelerybeat-schedule\ncelerybeat.pid\n\n# SageMath parsed files\n*.sage.py\n\n# Environments\n.env\n.venv\nenv/\nvenv/\nENV/\nenv.bak/\nvenv.bak/\n\n# Spyder project settings\n.spyderproject\n.spyproject\n\n# Rope project settings\n.ropeproject\n\n# mkdocs documentation\n/site\n\n# mypy\n.mypy_cache/\n.dmypy.json\ndmypy.json\n\n# Pyre type checker\n.pyre/\n"
+def create_gitignore(project_path):
+    gitignore_path = project_path / ".gitignore"
 
-    if check_and_overwrite_file(gitignore_path):
-        with open(gitignore_path, "w") as gitignore:
-            gitignore.write(gitignore_content)
+    if write_file(gitignore_path, _GITIGNORE_BYTES):
         logging.info(".gitignore file created.")
 
-def check_and_overwrite_file(file_path):
-    if os.path.exists(file_path):
-        response = get_yes_no_input(f"A file at {file_path} already exists. Do you want to overwrite it? (yes/no): ")
-        if response.lower() == 'yes' or response.lower() == 'y':
+def write_file(file_path, content):
+    """
+    Atomically writes the content bytes to file_path, asking before overwriting an existing file. Returns False if the user declines.
+    """
+    # Write the full content under a temporary name first so an interrupted run never leaves a half-written file
+    tmp_path = file_path.with_name(f"{file_path.name}.tmp.{os.getpid()}")
+    try:
+        tmp_path.write_bytes(content)
+        try:
+            # Linking fails if the target exists, which makes this an atomic exclusive create
+            os.link(tmp_path, file_path)
             return True
-        else:
-            logging.info(f"User chose not to overwrite the existing file: {file_path}")
-            return False
+        except FileExistsError:
+            pass
+        except OSError:
+            # Filesystems without hard links (FAT, some network mounts): reserve the name with an empty
+            # exclusive create, then move the complete temporary file over it
+            try:
+                open(file_path, "xb").close()
+            except FileExistsError:
+                pass
+            else:
+                os.replace(tmp_path, file_path)
+                return True
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+    # Only prompt once the temporary file is gone, so an abandoned prompt leaves nothing behind
+    if not get_yes_no_input(f"A file at {file_path} already exists. Do you want to overwrite it? (yes/no): "):
+        logging.info("User chose not to overwrite the existing file: %s", file_path)
+        return False
+    try:
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, file_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
     return True
 
-def create_project_structure(folder_name):
+def create_project_structure(project_path):
     """
-    Creates essential project directories: 'src' for source files and 'tests' for test files.
+    Creates the project folder along with its essential directories: 'src' for source files and 'tests' for test files.
     """
     try:
-        # Paths for the src and tests directories
-        src_path = os.path.join(folder_name, 'src')
-        tests_path = os.path.join(folder_name, 'tests')
-
-        # Create src directory if it doesn't exist
-        if not os.path.exists(src_path):
-            os.makedirs(src_path)
-            logging.info(f"Source directory created at: {src_path}")
-        else:
-            logging.info(f"Source directory already exists at: {src_path}")
-
-        # Create tests directory if it doesn't exist
-        if not os.path.exists(tests_path):
-            os.makedirs(tests_path)
-            logging.info(f"Tests directory created at: {tests_path}")
-        else:
-            logging.info(f"Tests directory already exists at: {tests_path}")
+        # mkdir(parents=True) creates project_path itself as part of the first leaf
+        for subdir in ('src', 'tests'):
+            subdir_path = project_path / subdir
+            subdir_path.mkdir(parents=True, exist_ok=True)
+            logging.info("'%s' directory ready at: %s", subdir, subdir_path)
 
     except OSError as e:
-        logging.error(f"Failed to create project directories in '{folder_name}': {e}")
+        logging.error("Failed to create project directories in '%s': %s", project_path, e)
         sys.exit(1)
 
-def main():
-    check_python3_installed()
+def parse_args(argv=None):
+    # Only needed when run as a script, so importers don't pay for argparse
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Set up a new Python project folder.")
+    answers = parser.add_mutually_exclusive_group()
+    answers.add_argument('--yes', dest='assume_answer', action='store_const', const=True,
+                         help="Answer 'yes' to every prompt instead of asking.")
+    answers.add_argument('--no', dest='assume_answer', action='store_const', const=False,
+                         help="Answer 'no' to every prompt instead of asking.")
+    return parser.parse_args(argv)
 
-    folder_name = input("Enter the name of your python project: ").strip()
-    verify_folder_name(folder_name)
+def main(assume_answer=None):
+    global _ASSUMED_ANSWER
+    previous_answer, _ASSUMED_ANSWER = _ASSUMED_ANSWER, assume_answer
+    try:
+        # Setup basic configuration for logging here rather than at import, so importers don't pay for it
+        logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
-    if manage_folder(folder_name):
-        logging.info(f"Setup will proceed using the folder: {folder_name}")
+        check_python3_installed()
 
-        create_pipfile(folder_name)
-        create_gitignore(folder_name)
-        create_project_structure(folder_name)  # Call the function to create src and tests directories
+        folder_name = input("Enter the name of your python project: ").strip()
+        if _FOLDER_NAME_RE.match(folder_name):
+            logging.info("'%s' is a valid folder name.", folder_name)
+        else:
+            logging.error("'%s' is not a valid folder name. Folder names must only contain alphanumeric characters, hyphens, and spaces.", folder_name)
+            sys.exit(1)
 
-    else:
-        logging.info("Setup was cancelled by the user.")
+        if manage_folder(folder_name):
+            logging.info("Setup will proceed using the folder: %s", folder_name)
+
+            # Build the project path once and hand it to each helper
+            project_path = Path(folder_name)
+            create_project_structure(project_path)  # Creates the project folder with its src and tests directories
+            create_pipfile(project_path)
+            create_gitignore(project_path)
+
+        else:
+            logging.info("Setup was cancelled by the user.")
+    finally:
+        # Restore the previous setting so later prompts in the same process aren't answered automatically
+        _ASSUMED_ANSWER = previous_answer
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(parse_args().assume_answer)
\ No newline at end of file
@@ -1,38 +1,161 @@
+import errno
+import os
+import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import patch
-from setup_project import main
+import setup_project
+from setup_project import main, create_project_structure, create_pipfile, get_yes_no_input, parse_args, _PIPFILE_BYTES
 
 class TestSetupProject(unittest.TestCase):
 
+    @patch('logging.basicConfig')
     @patch('builtins.input', return_value='valid_project')
     @patch('setup_project.check_python3_installed')
-    @patch('setup_project.verify_folder_name')
     @patch('setup_project.manage_folder', return_value=True)
+    @patch('setup_project.create_project_structure')
     @patch('setup_project.create_pipfile')
     @patch('setup_project.create_gitignore')
     @patch('logging.info')
-    def test_main_success(self, mock_log, mock_gitignore, mock_pipfile, mock_manage_folder, mock_verify, mock_check, mock_input):
+    def test_main_success(self, mock_log, mock_gitignore, mock_pipfile, mock_structure, mock_manage_folder, mock_check, mock_input, mock_basic_config):
         main()
         mock_check.assert_called_once()
         mock_input.assert_called_once()
-        mock_verify.assert_called_once_with('valid_project')
         mock_manage_folder.assert_called_once_with('valid_project')
-        mock_pipfile.assert_called_once_with('valid_project')
-        mock_gitignore.assert_called_once_with('valid_project')
-        mock_log.assert_called_with("Setup will proceed using the folder: valid_project")
+        mock_structure.assert_called_once_with(Path('valid_project'))
+        mock_pipfile.assert_called_once_with(Path('valid_project'))
+        mock_gitignore.assert_called_once_with(Path('valid_project'))
+        mock_log.assert_called_with("Setup will proceed using the folder: %s", 'valid_project')
 
+    @patch('logging.basicConfig')
     @patch('builtins.input', return_value='valid_project')
     @patch('setup_project.check_python3_installed')
-    @patch('setup_project.verify_folder_name')
     @patch('setup_project.manage_folder', return_value=False)
     @patch('logging.info')
-    def test_main_cancelled_by_user(self, mock_log, mock_manage_folder, mock_verify, mock_check, mock_input):
+    def test_main_cancelled_by_user(self, mock_log, mock_manage_folder, mock_check, mock_input, mock_basic_config):
         main()
         mock_check.assert_called_once()
         mock_input.assert_called_once()
-        mock_verify.assert_called_once_with('valid_project')
         mock_manage_folder.assert_called_once_with('valid_project')
         mock_log.assert_called_with("Setup was cancelled by the user.")
 
+    @patch('logging.basicConfig')
+    @patch('builtins.input', return_value='invalid/project')
+    @patch('setup_project.check_python3_installed')
+    @patch('setup_project.manage_folder')
+    @patch('logging.error')
+    def test_main_invalid_folder_name(self, mock_error, mock_manage_folder, mock_check, mock_input, mock_basic_config):
+        with self.assertRaises(SystemExit):
+            main()
+        mock_error.assert_called_once()
+        mock_manage_folder.assert_not_called()
+
+    @patch('logging.basicConfig')
+    @patch('setup_project.check_python3_installed')
+    @patch('logging.info')
+    def test_main_prompts_once_for_existing_pipfile(self, mock_log, mock_check, mock_basic_config):
+        with tempfile.TemporaryDirectory() as tmp:
+            old_cwd = os.getcwd()
+            os.chdir(tmp)
+            try:
+                project_path = Path('proj')
+                project_path.mkdir()
+                (project_path / 'Pipfile').write_text('existing')
+                # Project name, reuse the existing folder, keep the existing Pipfile
+                with patch('builtins.input', side_effect=['proj', 'yes', 'no']) as mock_input:
+                    main()
+                self.assertEqual(mock_input.call_count, 3)
+                self.assertIn('Pipfile', mock_input.call_args.args[0])
+                self.assertEqual((project_path / 'Pipfile').read_text(), 'existing')
+                self.assertTrue((project_path / '.gitignore').is_file())
+                self.assertEqual(sorted(p.name for p in project_path.iterdir()), ['.gitignore', 'Pipfile', 'src', 'tests'])
+            finally:
+                # Leave the directory before TemporaryDirectory removes it, which Windows requires
+                os.chdir(old_cwd)
+
+    @patch('logging.info')
+    def test_create_project_structure_is_idempotent(self, mock_log):
+        with tempfile.TemporaryDirectory() as tmp:
+            project_path = Path(tmp) / 'project'
+            create_project_structure(project_path)
+            create_project_structure(project_path)
+            self.assertTrue((project_path / 'src').is_dir())
+            self.assertTrue((project_path / 'tests').is_dir())
+
+    @patch('builtins.input')
+    @patch('logging.info')
+    def test_create_pipfile_in_empty_folder(self, mock_log, mock_input):
+        with tempfile.TemporaryDirectory() as tmp:
+            create_pipfile(Path(tmp))
+            mock_input.assert_not_called()
+            self.assertEqual(sorted(p.name for p in Path(tmp).iterdir()), ['Pipfile'])
+            self.assertEqual((Path(tmp) / 'Pipfile').read_bytes(), _PIPFILE_BYTES)
+
+    @patch('os.replace', wraps=os.replace)
+    @patch('os.link', side_effect=PermissionError(errno.EPERM, 'Operation not permitted'))
+    @patch('builtins.input')
+    @patch('logging.info')
+    def test_create_pipfile_without_hard_link_support(self, mock_log, mock_input, mock_link, mock_replace):
+        with tempfile.TemporaryDirectory() as tmp:
+            create_pipfile(Path(tmp))
+            mock_link.assert_called_once()
+            mock_input.assert_not_called()
+            # The complete temporary file is moved over the reserved name rather than written in place
+            tmp_path, target_path = mock_replace.call_args.args
+            self.assertEqual(Path(target_path), Path(tmp) / 'Pipfile')
+            self.assertTrue(Path(tmp_path).name.startswith('Pipfile.tmp.'))
+            self.assertEqual(sorted(p.name for p in Path(tmp).iterdir()), ['Pipfile'])
+            self.assertEqual((Path(tmp) / 'Pipfile').read_bytes(), _PIPFILE_BYTES)
+
+    @patch('builtins.input')
+    @patch('logging.info')
+    def test_create_pipfile_keeps_existing_file_when_declined(self, mock_log, mock_input):
+        with tempfile.TemporaryDirectory() as tmp:
+            pipfile_path = Path(tmp) / 'Pipfile'
+            pipfile_path.write_text('existing')
+            entries_at_prompt = []
+
+            def decline(prompt):
+                entries_at_prompt.extend(p.name for p in Path(tmp).iterdir())
+                return 'no'
+
+            mock_input.side_effect = decline
+            create_pipfile(Path(tmp))
+            mock_input.assert_called_once()
+            self.assertEqual(entries_at_prompt, ['Pipfile'])
+            self.assertEqual(pipfile_path.read_text(), 'existing')
+            self.assertEqual(sorted(p.name for p in Path(tmp).iterdir()), ['Pipfile'])
+
+    @patch('builtins.input', return_value='yes')
+    @patch('logging.info')
+    def test_create_pipfile_overwrites_existing_file_when_confirmed(self, mock_log, mock_input):
+        with tempfile.TemporaryDirectory() as tmp:
+            pipfile_path = Path(tmp) / 'Pipfile'
+            pipfile_path.write_text('existing')
+            create_pipfile(Path(tmp))
+            self.assertTrue(pipfile_path.read_text().startswith('# [[source]]'))
+            self.assertEqual(sorted(p.name for p in Path(tmp).iterdir()), ['Pipfile'])
+
+    @patch('builtins.input')
+    @patch('setup_project._ASSUMED_ANSWER', False)
+    @patch('logging.info')
+    def test_get_yes_no_input_uses_assumed_answer(self, mock_log, mock_input):
+        self.assertFalse(get_yes_no_input("Continue? (yes/no): "))
+        mock_input.assert_not_called()
+
+    @patch('logging.basicConfig')
+    @patch('builtins.input', return_value='valid_project')
+    @patch('setup_project.check_python3_installed')
+    @patch('setup_project.manage_folder', return_value=False)
+    @patch('logging.info')
+    def test_main_restores_assumed_answer(self, mock_log, mock_manage_folder, mock_check, mock_input, mock_basic_config):
+        main(True)
+        self.assertIsNone(setup_project._ASSUMED_ANSWER)
+
+    def test_parse_args_answer_flags(self):
+        self.assertIsNone(parse_args([]).assume_answer)
+        self.assertTrue(parse_args(['--yes']).assume_answer)
+        self.assertFalse(parse_args(['--no']).assume_answer)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file